@@ -9,6 +9,10 @@ from wagtail.admin import urls as wagtailadmin_urls
 from wagtail import urls as wagtail_urls
 from wagtail.documents import urls as wagtaildocs_urls
 
+# Resolved once at import time
+OSCAR_URLS = apps.get_app_config('oscar').urls[0]
+MEDIA_PATTERNS = static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+
 urlpatterns = [
     # Django Admin
     path("admin/", admin.site.urls),
@@ -27,14 +31,15 @@ urlpatterns = [
     path("accounts/", include("allauth.urls")),
     
     # Oscar e-commerce - This MUST come before Wagtail's catch-all
-    path('', include(apps.get_app_config('oscar').urls[0])),
+    path('', include(OSCAR_URLS)),
     
     # Wagtail's page serving mechanism (should be last)
     path('', include(wagtail_urls)),
     
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    *MEDIA_PATTERNS,
+]
 
 if settings.DEBUG:
     if "debug_toolbar" in settings.INSTALLED_APPS:
         import debug_toolbar
-        urlpatterns = [path("__debug__/", include(debug_toolbar.urls))] + urlpatterns
\ No newline at end of file
+        urlpatterns.insert(0, path("__debug__/", include(debug_toolbar.urls)))
\ No newline at end of file
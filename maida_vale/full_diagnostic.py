@@ -7,79 +7,114 @@ Checks for all common issues in Django + Oscar + Wagtail projects
 import os
 import sys
 import json
+import importlib.metadata
+import importlib.util
 import re
+from collections import Counter
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent
+
 # Add project to path
-sys.path.insert(0, '/Users/saman/Maida/maida_vale')
+sys.path.insert(0, str(PROJECT_ROOT))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
 os.environ.setdefault('DJANGO_READ_DOT_ENV_FILE', 'True')
 
 class ProjectDiagnostic:
     def __init__(self):
-        self.project_root = Path('/Users/saman/Maida/maida_vale')
+        self.project_root = PROJECT_ROOT
         self.issues = []
         self.warnings = []
         self.fixes = []
+        self._buf = []
+        # One directory listing each for the project root and the app package
+        self._root_entries = self._scan(self.project_root)
+        self._subdir_entries = self._scan(self.project_root / 'maida_vale')
+        
+    def _log(self, msg):
+        """Queue a progress line; written out in one go by _flush()"""
+        self._buf.append(msg + '\n')
         
+    def _flush(self):
+        """Write all queued progress lines with a single stdout write"""
+        sys.stdout.write(''.join(self._buf))
+        sys.stdout.flush()
+        self._buf.clear()
+        
+    @staticmethod
+    def _scan(directory):
+        """Map entry names to DirEntry objects, or {} if the directory is missing"""
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name: entry for entry in it}
+        except OSError:
+            return {}
+            
     def run_all_checks(self):
-        print("\n" + "="*60)
-        print("COMPREHENSIVE DJANGO PROJECT DIAGNOSTIC")
-        print("="*60)
+        self._log("\n" + "="*60)
+        self._log("COMPREHENSIVE DJANGO PROJECT DIAGNOSTIC")
+        self._log("="*60)
         
-        self.check_environment()
-        self.check_dependencies()
-        self.check_settings()
-        self.check_urls()
-        self.check_models()
-        self.check_migrations()
-        self.check_templates()
-        self.check_static_files()
-        self.generate_fixes()
+        # Flush even if a check raises, so earlier progress isn't lost
+        try:
+            self.check_environment()
+            self.check_dependencies()
+            self.check_settings()
+            self.check_urls()
+            self.check_models()
+            self.check_migrations()
+            self.check_templates()
+            self.check_static_files()
+            self.generate_fixes()
+        finally:
+            self._flush()
         self.print_report()
         
     def check_environment(self):
-        print("\n🔍 Checking Environment...")
+        self._log("\n🔍 Checking Environment...")
         
         # Check Python version
         import sys
         python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-        print(f"   Python Version: {python_version}")
+        self._log(f"   Python Version: {python_version}")
         
         # Check .env file
         env_file = self.project_root / '.env'
-        if env_file.exists():
+        if '.env' in self._root_entries:
+            # Parse KEY=value lines in a single pass
+            env_vars = {}
             with open(env_file) as f:
-                env_content = f.read()
-                required_vars = ['DJANGO_SECRET_KEY', 'DATABASE_URL']
-                for var in required_vars:
-                    if var not in env_content:
-                        self.issues.append(f"Missing {var} in .env")
-                    elif f"{var}=your-" in env_content or f"{var}='your-" in env_content:
-                        self.issues.append(f"{var} has placeholder value in .env")
+                for line in f:
+                    key, _, value = line.partition('=')
+                    env_vars[key.strip()] = value.strip()
+                    
+            required_vars = ['DJANGO_SECRET_KEY', 'DATABASE_URL']
+            for var in required_vars:
+                if var not in env_vars:
+                    self.issues.append(f"Missing {var} in .env")
+                elif env_vars[var].startswith(("your-", "'your-")):
+                    self.issues.append(f"{var} has placeholder value in .env")
         else:
             self.issues.append(".env file missing")
             
     def check_dependencies(self):
-        print("\n🔍 Checking Dependencies...")
+        self._log("\n🔍 Checking Dependencies...")
         
-        try:
-            import django
-            print(f"   Django: {django.get_version()}")
-        except ImportError:
+        # Probe for packages without executing their module bodies
+        if importlib.util.find_spec('django') is None:
             self.issues.append("Django not installed")
+        else:
+            self._log(f"   Django: {importlib.metadata.version('django')}")
             
-        try:
-            import oscar
-            print(f"   Oscar: installed")
-        except ImportError:
+        if importlib.util.find_spec('oscar') is None:
             self.issues.append("Django-Oscar not installed")
+        else:
+            self._log(f"   Oscar: installed")
             
-        try:
-            import wagtail
-            print(f"   Wagtail: installed")
-        except ImportError:
+        if importlib.util.find_spec('wagtail') is None:
             self.issues.append("Wagtail not installed")
+        else:
+            self._log(f"   Wagtail: installed")
             
         # Check for other required packages
         required_packages = [
@@ -87,14 +122,14 @@ class ProjectDiagnostic:
             'whitenoise', 'fido2', 'django_celery_beat'
         ]
         
+        # One pass over installed distribution metadata, keyed by import name
+        installed = importlib.metadata.packages_distributions()
         for package in required_packages:
-            try:
-                __import__(package)
-            except ImportError:
+            if package not in installed:
                 self.issues.append(f"Missing package: {package}")
                 
     def check_settings(self):
-        print("\n🔍 Checking Settings...")
+        self._log("\n🔍 Checking Settings...")
         
         try:
             from django.conf import settings
@@ -102,16 +137,15 @@ class ProjectDiagnostic:
             # Check for Oscar defaults import
             base_settings = self.project_root / 'config/settings/base.py'
             if base_settings.exists():
-                with open(base_settings) as f:
-                    content = f.read()
-                    if 'from oscar.defaults import *' in content:
-                        print("   Oscar defaults imported: ✓")
-                    else:
-                        self.issues.append("Oscar defaults not imported in base.py")
+                content = base_settings.read_text()
+                if 'from oscar.defaults import *' in content:
+                    self._log("   Oscar defaults imported: ✓")
+                else:
+                    self.issues.append("Oscar defaults not imported in base.py")
                         
             # Check INSTALLED_APPS for duplicates
-            installed_apps = list(settings.INSTALLED_APPS)
-            duplicates = set([x for x in installed_apps if installed_apps.count(x) > 1])
+            counts = Counter(settings.INSTALLED_APPS)
+            duplicates = {app for app, count in counts.items() if count > 1}
             if duplicates:
                 self.issues.append(f"Duplicate apps in INSTALLED_APPS: {duplicates}")
                 
@@ -119,35 +153,34 @@ class ProjectDiagnostic:
             self.issues.append(f"Cannot load settings: {str(e)}")
             
     def check_urls(self):
-        print("\n🔍 Checking URL Configuration...")
+        self._log("\n🔍 Checking URL Configuration...")
         
         urls_file = self.project_root / 'config/urls.py'
         if urls_file.exists():
-            with open(urls_file) as f:
-                content = f.read()
+            content = urls_file.read_text()
+            
+            # Check for Oscar URLs
+            if "apps.get_app_config('oscar')" not in content:
+                self.issues.append("Oscar URLs not included in config/urls.py")
+                self.fixes.append({
+                    'file': 'config/urls.py',
+                    'issue': 'Missing Oscar URLs',
+                    'fix': "Add: path('', include(apps.get_app_config('oscar').urls[0])),"
+                })
+                
+            # Check for Wagtail URLs
+            if 'wagtailadmin_urls' not in content:
+                self.issues.append("Wagtail admin URLs not included")
+                
+            if 'wagtail_urls' not in content:
+                self.issues.append("Wagtail URLs not included")
+                
+            # Check imports
+            if 'from django.apps import apps' not in content:
+                self.issues.append("Missing 'from django.apps import apps' import")
                 
-                # Check for Oscar URLs
-                if "apps.get_app_config('oscar')" not in content:
-                    self.issues.append("Oscar URLs not included in config/urls.py")
-                    self.fixes.append({
-                        'file': 'config/urls.py',
-                        'issue': 'Missing Oscar URLs',
-                        'fix': "Add: path('', include(apps.get_app_config('oscar').urls[0])),"
-                    })
-                    
-                # Check for Wagtail URLs
-                if 'wagtailadmin_urls' not in content:
-                    self.issues.append("Wagtail admin URLs not included")
-                    
-                if 'wagtail_urls' not in content:
-                    self.issues.append("Wagtail URLs not included")
-                    
-                # Check imports
-                if 'from django.apps import apps' not in content:
-                    self.issues.append("Missing 'from django.apps import apps' import")
-                    
     def check_models(self):
-        print("\n🔍 Checking Models...")
+        self._log("\n🔍 Checking Models...")
         
         # Check if custom user model exists
         user_model = self.project_root / 'maida_vale/users/models.py'
@@ -155,42 +188,41 @@ class ProjectDiagnostic:
             self.issues.append("Custom user model file missing")
             
     def check_migrations(self):
-        print("\n🔍 Checking Migrations...")
+        self._log("\n🔍 Checking Migrations...")
         
         try:
             import django
             django.setup()
-            from django.core.management import call_command
-            from io import StringIO
+            from django.db import connection
+            from django.db.migrations.loader import MigrationLoader
             
-            out = StringIO()
-            call_command('showmigrations', '--plan', stdout=out, verbosity=0)
-            migrations_output = out.getvalue()
+            # Compare the migration graph against the recorded migrations directly
+            loader = MigrationLoader(connection)
+            applied = loader.applied_migrations
+            unapplied = [node for node in loader.graph.nodes if node not in applied]
             
-            if '[ ]' in migrations_output:
-                self.warnings.append("Unapplied migrations detected")
+            if unapplied:
+                self.warnings.append(f"Unapplied migrations detected: {len(unapplied)}")
                 
         except Exception as e:
             self.warnings.append(f"Cannot check migrations: {str(e)}")
             
     def check_templates(self):
-        print("\n🔍 Checking Templates...")
+        self._log("\n🔍 Checking Templates...")
         
-        templates_dir = self.project_root / 'maida_vale/templates'
-        if not templates_dir.exists():
+        if 'templates' not in self._subdir_entries:
             self.warnings.append("Templates directory missing")
             
     def check_static_files(self):
-        print("\n🔍 Checking Static Files...")
+        self._log("\n🔍 Checking Static Files...")
         
-        static_dir = self.project_root / 'maida_vale/static'
-        if not static_dir.exists():
+        if 'static' not in self._subdir_entries:
             self.warnings.append("Static directory missing")
             
     def generate_fixes(self):
         """Generate fix script for identified issues"""
         
-        if 'Oscar URLs not included in config/urls.py' in str(self.issues):
+        if 'Oscar URLs not included in config/urls.py' in self.issues:
             self.fixes.append({
                 'description': 'Fix URL configuration',
                 'script': '''
@@ -253,19 +285,22 @@ if settings.DEBUG:
         """Write a script to fix all issues"""
         
         fix_script = self.project_root / 'auto_fix.py'
-        with open(fix_script, 'w') as f:
-            f.write("#!/usr/bin/env python\n")
-            f.write("# Auto-generated fix script\n\n")
-            f.write("import os\n")
-            f.write("os.chdir('/Users/saman/Maida/maida_vale')\n\n")
-            
-            for fix in self.fixes:
-                if 'script' in fix:
-                    f.write(f"# Fix: {fix.get('description', '')}\n")
-                    f.write(fix['script'])
-                    f.write("\n\n")
-                    
-            f.write("print('\\n✅ All fixes applied!')\n")
+        parts = [
+            "#!/usr/bin/env python\n",
+            "# Auto-generated fix script\n\n",
+            "import os\n",
+            "from pathlib import Path\n",
+            "os.chdir(Path(__file__).resolve().parent)\n\n",
+        ]
+        
+        for fix in self.fixes:
+            if 'script' in fix:
+                parts.append(f"# Fix: {fix.get('description', '')}\n")
+                parts.append(fix['script'])
+                parts.append("\n\n")
+                
+        parts.append("print('\\n✅ All fixes applied!')\n")
+        fix_script.write_text(''.join(parts))
             
         print(f"\n💡 Fix script created: auto_fix.py")
         print("   Run: python auto_fix.py")
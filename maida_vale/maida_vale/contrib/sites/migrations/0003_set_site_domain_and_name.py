@@ -8,18 +8,13 @@ def update_site_forward(apps, schema_editor):
     Site = apps.get_model("sites", "Site")
     
     # Use a simple approach that works with SQLite
-    site, created = Site.objects.get_or_create(
+    Site.objects.update_or_create(
         id=1,
         defaults={
             'domain': 'localhost:8000',
             'name': 'Salbion Local Development'
         }
     )
-    
-    if not created:
-        site.domain = 'localhost:8000'
-        site.name = 'Salbion Local Development'
-        site.save()
 
 def update_site_backward(apps, schema_editor):
     """Revert site settings"""
@@ -3,6 +3,7 @@ from pathlib import Path
 urls_path = Path('config/urls.py')
 
 # Create a proper URL configuration
+# Every route uses path() and urlpatterns is built as a tuple in one pass
 urls_content = '''from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
@@ -11,7 +12,7 @@ from django.views import defaults as default_views
 from django.views.generic import TemplateView
 from oscar.app import application as oscar_app
 
-urlpatterns = [
+urlpatterns = (
     # Django Admin
     path(settings.ADMIN_URL, admin.site.urls),
     
@@ -21,11 +22,13 @@ urlpatterns = [
     
     # Oscar e-commerce - this should come last as it has a catch-all
     path("", oscar_app.urls),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    *static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT),
+)
 
 if settings.DEBUG:
     # This allows the error pages to be debugged during development
-    urlpatterns += [
+    urlpatterns = (
+        *urlpatterns,
         path(
             "400/",
             default_views.bad_request,
@@ -42,13 +45,13 @@ if settings.DEBUG:
             kwargs={"exception": Exception("Page not Found")},
         ),
         path("500/", default_views.server_error),
-    ]
+    )
     if "debug_toolbar" in settings.INSTALLED_APPS:
         import debug_toolbar
-        urlpatterns = [path("__debug__/", include(debug_toolbar.urls))] + urlpatterns
+        debug_toolbar_patterns = (path("__debug__/", include(debug_toolbar.urls)),)
+        urlpatterns = (*debug_toolbar_patterns, *urlpatterns)
 '''
 
-with open(urls_path, 'w') as f:
-    f.write(urls_content)
+urls_path.write_text(urls_content)
 
 print("✅ Updated URL configuration with Oscar integration")
@@ -0,0 +1,49 @@
+"""
+Shared read/write helpers for config/settings/base.py
+Used by the fix_*.py scripts so chained fixes only hit the disk when something changed
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+BASE_SETTINGS_PATH = Path('config/settings/base.py')
+
+
+def _resolve(path):
+    """Normalise a settings path so every call form shares one cache entry"""
+    return Path(path or BASE_SETTINGS_PATH).resolve()
+
+
+@lru_cache(maxsize=None)
+def _read(path):
+    return path.read_text(encoding='utf-8')
+
+
+def read_base(path=None):
+    """Return the settings file text, cached until the next write"""
+    return _read(_resolve(path))
+
+
+def write_base(content, path=None):
+    """Write the settings file unless unchanged, invalidating the cached read"""
+    resolved = _resolve(path)
+    if content == _read(resolved):
+        return False
+    _read.cache_clear()
+    resolved.write_text(content, encoding='utf-8')
+    return True
+
+
+def write_base_lines(lines, path=None):
+    """Write an iterable of lines to the settings file unless unchanged"""
+    return write_base(''.join(lines), path)
+
+
+def write_if_changed(path, content, encoding='utf-8'):
+    """Write content to path unless the file already holds exactly those bytes"""
+    path = Path(path)
+    data = content.encode(encoding)
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
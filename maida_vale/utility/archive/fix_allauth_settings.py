@@ -1,9 +1,6 @@
-from pathlib import Path
+from _base_io import read_base, write_base
 
-base_settings_path = Path('config/settings/base.py')
-
-with open(base_settings_path, 'r') as f:
-    content = f.read()
+content = read_base()
 
 # Replace deprecated settings with new format
 old_settings = '''ACCOUNT_AUTHENTICATION_METHOD = "username"
@@ -16,7 +13,7 @@ ACCOUNT_SIGNUP_FIELDS = ['email*', 'username*', 'password1*', 'password2*']'''
 
 content = content.replace(old_settings, new_settings)
 
-with open(base_settings_path, 'w') as f:
-    f.write(content)
-
-print("✅ Updated allauth settings to new format")
+if write_base(content):
+    print("✅ Updated allauth settings to new format")
+else:
+    print("No changes")
@@ -1,41 +1,45 @@
 #!/usr/bin/env python
-from pathlib import Path
+import mmap
+import os
 import re
 
-base_settings_path = Path('config/settings/base.py')
+from _base_io import BASE_SETTINGS_PATH, read_base, write_base
 
-with open(base_settings_path, 'r') as f:
-    content = f.read()
+_TABLES2_LINE_RE = re.compile(r'^.*django_tables2.*\n?', re.MULTILINE)
 
-# Count occurrences
-occurrences = content.count('"django_tables2"')
+# Count occurrences on a read-only mapping, without building a str
+# (an empty file can't be mapped, and holds no occurrences anyway)
+occurrences = 0
+with open(BASE_SETTINGS_PATH, 'rb') as f:
+    if os.fstat(f.fileno()).st_size:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            i = mm.find(b'"django_tables2"')
+            while i != -1:
+                occurrences += 1
+                i = mm.find(b'"django_tables2"', i + 1)
 print(f"Found {occurrences} occurrences of django_tables2")
 
 if occurrences > 1:
+    content = read_base()
+    
     # Remove the django_tables2 that was added with Oscar apps
     # Keep the first occurrence, remove from the Oscar section
-    lines = content.split('\n')
-    found_first = False
-    new_lines = []
-    
-    for line in lines:
-        if 'django_tables2' in line:
-            if not found_first:
-                found_first = True
-                new_lines.append(line)
-                print(f"Keeping first occurrence: {line.strip()}")
-            else:
-                print(f"Removing duplicate: {line.strip()}")
-                # Skip this line
-                continue
-        else:
-            new_lines.append(line)
+    seen = []  # closure flag: non-empty once the first line has been kept
     
-    content = '\n'.join(new_lines)
+    def keep_first(match):
+        line = match.group(0)
+        if seen:
+            print(f"Removing duplicate: {line.strip()}")
+            return ''  # drop the whole line including its newline
+        seen.append(True)
+        print(f"Keeping first occurrence: {line.strip()}")
+        return line
     
-    with open(base_settings_path, 'w') as f:
-        f.write(content)
+    content = _TABLES2_LINE_RE.sub(keep_first, content)
     
-    print("✅ Removed duplicate django_tables2")
+    if write_base(content):
+        print("✅ Removed duplicate django_tables2")
+    else:
+        print("No changes")
 else:
     print("No duplicates found")
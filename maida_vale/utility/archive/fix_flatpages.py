@@ -1,30 +1,32 @@
 #!/usr/bin/env python
-from pathlib import Path
+import re
 
-base_settings_path = Path('config/settings/base.py')
+from _base_io import read_base, write_base
 
-with open(base_settings_path, 'r') as f:
-    content = f.read()
+content = read_base()
+
+# Collect the edits so every anchor is rewritten in a single pass
+replacements = {}
 
 # Add flatpages to DJANGO_APPS
 if 'django.contrib.flatpages' not in content:
-    # Find DJANGO_APPS and add flatpages
-    content = content.replace(
-        '"django.contrib.admin",',
-        '"django.contrib.admin",\n    "django.contrib.flatpages",'
-    )
+    replacements['"django.contrib.admin",'] = '"django.contrib.admin",\n    "django.contrib.flatpages",'
     print("✅ Added django.contrib.flatpages to DJANGO_APPS")
 
 # Add flatpages middleware
 if 'django.contrib.flatpages.middleware.FlatpageFallbackMiddleware' not in content:
     # Add at the end of MIDDLEWARE
-    content = content.replace(
-        '"wagtail.contrib.redirects.middleware.RedirectMiddleware",',
-        '"wagtail.contrib.redirects.middleware.RedirectMiddleware",\n    "django.contrib.flatpages.middleware.FlatpageFallbackMiddleware",'
+    replacements['"wagtail.contrib.redirects.middleware.RedirectMiddleware",'] = (
+        '"wagtail.contrib.redirects.middleware.RedirectMiddleware",'
+        '\n    "django.contrib.flatpages.middleware.FlatpageFallbackMiddleware",'
     )
     print("✅ Added FlatpageFallbackMiddleware")
 
-with open(base_settings_path, 'w') as f:
-    f.write(content)
+if replacements:
+    pattern = re.compile('|'.join(re.escape(anchor) for anchor in replacements))
+    content = pattern.sub(lambda match: replacements[match.group(0)], content)
 
-print("✅ Flatpages configuration complete")
+if write_base(content):
+    print("✅ Flatpages configuration complete")
+else:
+    print("No changes")
@@ -1,9 +1,10 @@
-from pathlib import Path
+import re
+
+from _base_io import read_base, write_base
 
-base_settings_path = Path('config/settings/base.py')
+_LOCAL_APPS_RE = re.compile(r'LOCAL_APPS\s*=\s*\[.*?\]', re.DOTALL)
 
-with open(base_settings_path, 'r') as f:
-    content = f.read()
+content = read_base()
 
 # Update LOCAL_APPS to include all your apps
 local_apps_replacement = '''LOCAL_APPS = [
@@ -13,15 +14,9 @@ local_apps_replacement = '''LOCAL_APPS = [
     "maida_vale.uk_compliance",
 ]'''
 
-import re
-content = re.sub(
-    r'LOCAL_APPS\s*=\s*\[.*?\]',
-    local_apps_replacement,
-    content,
-    flags=re.DOTALL
-)
-
-with open(base_settings_path, 'w') as f:
-    f.write(content)
+content = _LOCAL_APPS_RE.sub(local_apps_replacement, content)
 
-print("✅ Updated LOCAL_APPS")
+if write_base(content):
+    print("✅ Updated LOCAL_APPS")
+else:
+    print("No changes")
@@ -1,28 +1,29 @@
-from pathlib import Path
+from _base_io import read_base, write_base
 
-base_settings_path = Path('config/settings/base.py')
+content = read_base()
 
-with open(base_settings_path, 'r') as f:
-    lines = f.readlines()
-
-new_lines = []
-found_basket_middleware = False
 basket_middleware_line = '    "oscar.apps.basket.middleware.BasketMiddleware",\n'
+basket_marker = 'oscar.apps.basket.middleware.BasketMiddleware'
+auth_marker = 'django.contrib.auth.middleware.AuthenticationMiddleware'
+
+# Locate both anchors once instead of testing every line
+basket_idx = content.find(basket_marker)
+auth_idx = content.find(auth_marker)
 
-for line in lines:
-    # Skip the BasketMiddleware line where it currently is (too early)
-    if 'oscar.apps.basket.middleware.BasketMiddleware' in line:
-        found_basket_middleware = True
-        continue  # Skip this line, we'll add it later
+if basket_idx != -1 and auth_idx != -1 and basket_idx < auth_idx:
+    # Cut the BasketMiddleware line where it currently is (too early)
+    line_start = content.rfind('\n', 0, basket_idx) + 1
+    line_end = content.find('\n', basket_idx) + 1 or len(content)
+    content = content[:line_start] + content[line_end:]
     
-    # Add the line normally
-    new_lines.append(line)
+    # Splice it back in right after AuthenticationMiddleware
+    auth_idx = content.find(auth_marker)
+    auth_eol = content.find('\n', auth_idx) + 1 or len(content)
+    content = content[:auth_eol] + basket_middleware_line + content[auth_eol:]
     
-    # After AuthenticationMiddleware, add BasketMiddleware
-    if 'django.contrib.auth.middleware.AuthenticationMiddleware' in line and found_basket_middleware:
-        new_lines.append(basket_middleware_line)
-
-with open(base_settings_path, 'w') as f:
-    f.writelines(new_lines)
-
-print("✅ Fixed middleware order - BasketMiddleware now comes AFTER AuthenticationMiddleware")
+    if write_base(content):
+        print("✅ Fixed middleware order - BasketMiddleware now comes AFTER AuthenticationMiddleware")
+    else:
+        print("No changes")
+else:
+    print("No change needed - BasketMiddleware is not ahead of AuthenticationMiddleware")
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from _base_io import write_if_changed
+
 urls_path = Path('config/urls.py')
 
 # Fix the Oscar import for version 4.0
@@ -50,7 +52,7 @@ if settings.DEBUG:
         urlpatterns = [path("__debug__/", include(debug_toolbar.urls))] + urlpatterns
 '''
 
-with open(urls_path, 'w') as f:
-    f.write(urls_content)
-
-print("✅ Fixed Oscar import for version 4.0")
+if write_if_changed(urls_path, urls_content):
+    print("✅ Fixed Oscar import for version 4.0")
+else:
+    print("No changes")
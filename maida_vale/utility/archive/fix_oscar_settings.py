@@ -2,24 +2,45 @@
 import os
 import re
 from pathlib import Path
-from datetime import datetime
+
+from _base_io import read_base, write_base
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_THIRD_PARTY_RE = re.compile(r'(THIRD_PARTY_APPS\s*=\s*\[)([\s\S]*?)(\])')
+_INSTALLED_RE = re.compile(r'INSTALLED_APPS\s*=\s*[^\n]+')
+
+# Markers probed in base.py, matched together in a single scan
+_MARKERS = {
+    'core_apps_import': re.escape('from oscar import get_core_apps'),
+    'core_apps_call': re.escape('get_core_apps()'),
+    'installed_apps': re.escape('INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS'),
+    'oscar_defaults': re.escape('from oscar.defaults import *'),
+    'shop_name': re.escape('OSCAR_SHOP_NAME'),
+    'site_id': r'SITE_ID\s*=\s*\d+',
+}
+_MARKERS_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in _MARKERS.items()))
 
 def fix_oscar_configuration():
     """Fix Oscar configuration in base.py"""
     
-    base_settings_path = Path('/Users/saman/Maida/maida_vale/config/settings/base.py')
+    base_settings_path = PROJECT_ROOT / 'config/settings/base.py'
     
-    # Create backup
-    backup_path = base_settings_path.with_suffix(f'.backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}')
-    import shutil
-    shutil.copy(base_settings_path, backup_path)
-    print(f"✅ Created backup: {backup_path}")
+    # Create backup (set SKIP_BACKUP to skip it on re-runs)
+    if not os.environ.get('SKIP_BACKUP'):
+        import shutil
+        from datetime import datetime
+        backup_path = base_settings_path.with_suffix(f'.backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}')
+        shutil.copy(base_settings_path, backup_path)
+        print(f"✅ Created backup: {backup_path}")
     
-    with open(base_settings_path, 'r') as f:
-        content = f.read()
+    content = read_base(base_settings_path)
+    # None of the edits below add a marker that a later check looks for,
+    # so the markers present in the original file answer every check
+    present = {match.lastgroup for match in _MARKERS_RE.finditer(content)}
     
     # First, add the import for get_core_apps at the top
-    if 'from oscar import get_core_apps' not in content:
+    if 'core_apps_import' not in present:
         # Find the imports section and add Oscar import
         import_lines = content.split('\n')
         for i, line in enumerate(import_lines):
@@ -30,9 +51,6 @@ def fix_oscar_configuration():
         print("✅ Added 'from oscar import get_core_apps' import")
     
     # Now fix the INSTALLED_APPS section
-    # Find where THIRD_PARTY_APPS is defined
-    third_party_pattern = r'(THIRD_PARTY_APPS\s*=\s*\[)([\s\S]*?)(\])'
-    
     def replace_third_party_apps(match):
         start = match.group(1)
         apps = match.group(2)
@@ -58,26 +76,25 @@ def fix_oscar_configuration():
             return match.group(0)
     
     # Apply the fix
-    if 'get_core_apps()' not in content:
-        content = re.sub(third_party_pattern, replace_third_party_apps, content)
+    if 'core_apps_call' not in present:
+        content = _THIRD_PARTY_RE.sub(replace_third_party_apps, content)
         print("✅ Added get_core_apps() to THIRD_PARTY_APPS")
     
     # Ensure INSTALLED_APPS combines all app lists
-    if 'INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS' not in content:
+    if 'installed_apps' not in present:
         # This should already be there, but let's make sure
-        installed_pattern = r'INSTALLED_APPS\s*=\s*[^\n]+'
-        if re.search(installed_pattern, content):
-            content = re.sub(installed_pattern, 'INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS', content)
+        if _INSTALLED_RE.search(content):
+            content = _INSTALLED_RE.sub('INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS', content)
             print("✅ Fixed INSTALLED_APPS definition")
     
     # Make sure oscar.defaults import is present
-    if 'from oscar.defaults import *' not in content:
+    if 'oscar_defaults' not in present:
         # Add it at the end of the file
         content += '\n# Import Oscar default settings\nfrom oscar.defaults import *\n'
         print("✅ Added Oscar defaults import")
     
     # Add essential Oscar settings if not present
-    if 'OSCAR_SHOP_NAME' not in content:
+    if 'shop_name' not in present:
         oscar_settings = '''
 # Oscar-specific settings
 OSCAR_SHOP_NAME = "Maida Vale"
@@ -97,16 +114,16 @@ OSCAR_DASHBOARD_NAVIGATION += [
         print("✅ Added Oscar-specific settings")
     
     # Ensure SITE_ID is set (required for Oscar)
-    if not re.search(r'SITE_ID\s*=\s*\d+', content):
+    if 'site_id' not in present:
         # Add before oscar.defaults import
         content = content.replace('from oscar.defaults import *', 'SITE_ID = 1\n\nfrom oscar.defaults import *')
         print("✅ Added SITE_ID setting")
     
     # Write the updated content back
-    with open(base_settings_path, 'w') as f:
-        f.write(content)
-    
-    print("\n✅ Configuration updated successfully!")
+    if write_base(content, base_settings_path):
+        print("\n✅ Configuration updated successfully!")
+    else:
+        print("\nNo changes")
     return True
 
 if __name__ == "__main__":
@@ -4,10 +4,47 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+from _base_io import read_base, write_base
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_SITE_ID_RE = re.compile(r'SITE_ID\s*=\s*\d+')
+_THIRD_PARTY_ASSIGN_RE = re.compile(r'^THIRD_PARTY_APPS\s*=\s*\[', re.MULTILINE)
+_OSCAR_TOKENS = ("'oscar'", '"oscar"')
+_CORE_APPS_CALL_RE = re.compile(r'\]\s*\+\s*get_core_apps\(\)([ \t]*#[^\n]*)?')
+
+def _has_site_id(s):
+    """Cheap str.find gate on 'SITE_ID', confirmed with an anchored regex match"""
+    idx = s.find('SITE_ID')
+    while idx != -1:
+        if _SITE_ID_RE.match(s, idx):
+            return True
+        idx = s.find('SITE_ID', idx + 1)
+    return False
+
+def _find_list_block(s, assign_re):
+    """Return (start, end) offsets of the brackets of the list opened by assign_re, or None"""
+    match = assign_re.search(s)
+    if not match:
+        return None
+    start = match.end() - 1
+    
+    # Walk forward tracking bracket depth so nested lists don't end the block early
+    depth = 0
+    for j in range(start, len(s)):
+        c = s[j]
+        if c == '[':
+            depth += 1
+        elif c == ']':
+            depth -= 1
+            if depth == 0:
+                return start, j
+    return None
+
 def fix_oscar_v4_configuration():
     """Fix Oscar 4.0 configuration in base.py"""
     
-    base_settings_path = Path('/Users/saman/Maida/maida_vale/config/settings/base.py')
+    base_settings_path = PROJECT_ROOT / 'config/settings/base.py'
     
     # Create backup
     backup_path = base_settings_path.with_suffix(f'.backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}')
@@ -15,8 +52,7 @@ def fix_oscar_v4_configuration():
     shutil.copy(base_settings_path, backup_path)
     print(f"✅ Created backup: {backup_path}")
     
-    with open(base_settings_path, 'r') as f:
-        content = f.read()
+    content = read_base(base_settings_path)
     
     # Remove the old import that doesn't work with Oscar 4.0
     content = content.replace('from oscar import get_core_apps', '')
@@ -61,38 +97,30 @@ def fix_oscar_v4_configuration():
 '''
     
     # Find and update THIRD_PARTY_APPS
-    if '] + get_core_apps()' in content:
-        # Remove the get_core_apps() call
-        content = content.replace('] + get_core_apps()  # Add all Oscar apps', ']')
-        content = content.replace('] + get_core_apps()', ']')
+    # Remove the get_core_apps() call, with or without a trailing comment
+    content = _CORE_APPS_CALL_RE.sub(']', content)
     
     # Now add Oscar apps to THIRD_PARTY_APPS
-    third_party_pattern = r'(THIRD_PARTY_APPS\s*=\s*\[)([\s\S]*?)(\])'
-    
-    def update_third_party_apps(match):
-        start = match.group(1)
-        apps = match.group(2)
-        end = match.group(3)
-        
+    def update_third_party_apps(apps):
         # Check if Oscar apps are already added
         if 'oscar.config.Shop' not in apps:
             # Remove any standalone 'oscar' entry
-            apps_lines = apps.split('\n')
-            filtered_lines = []
-            for line in apps_lines:
-                if "'oscar'" not in line and '"oscar"' not in line:
-                    filtered_lines.append(line)
-            
-            apps = '\n'.join(filtered_lines)
+            apps = '\n'.join(
+                line for line in apps.split('\n')
+                if not any(t in line for t in _OSCAR_TOKENS)
+            )
             # Add Oscar apps
             apps = apps.rstrip().rstrip(',')
             if apps.strip():
                 apps += ',\n'
             apps += oscar_apps
         
-        return f'{start}{apps}{end}'
+        return apps
     
-    content = re.sub(third_party_pattern, update_third_party_apps, content)
+    block = _find_list_block(content, _THIRD_PARTY_ASSIGN_RE)
+    if block:
+        start, end = block
+        content = content[:start + 1] + update_third_party_apps(content[start + 1:end]) + content[end:]
     print("✅ Added Oscar 4.0 apps to THIRD_PARTY_APPS")
     
     # Ensure we have the required middleware for Oscar
@@ -109,7 +137,7 @@ def fix_oscar_v4_configuration():
         print("✅ Added Oscar middleware")
     
     # Ensure SITE_ID is set
-    if not re.search(r'SITE_ID\s*=\s*\d+', content):
+    if not _has_site_id(content):
         # Add before oscar.defaults import if it exists, otherwise at the end
         if 'from oscar.defaults import *' in content:
             content = content.replace('from oscar.defaults import *', 'SITE_ID = 1\n\nfrom oscar.defaults import *')
@@ -118,10 +146,10 @@ def fix_oscar_v4_configuration():
         print("✅ Added SITE_ID setting")
     
     # Write back
-    with open(base_settings_path, 'w') as f:
-        f.write(content)
-    
-    print("\n✅ Oscar 4.0 configuration complete!")
+    if write_base(content, base_settings_path):
+        print("\n✅ Oscar 4.0 configuration complete!")
+    else:
+        print("\nNo changes")
     return True
 
 if __name__ == "__main__":
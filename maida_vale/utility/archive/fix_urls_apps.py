@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from _base_io import write_if_changed
+
 urls_path = Path('config/urls.py')
 
 urls_content = '''from django.apps import apps
@@ -30,7 +32,7 @@ if settings.DEBUG:
         urlpatterns = [path("__debug__/", include(debug_toolbar.urls))] + urlpatterns
 '''
 
-with open(urls_path, 'w') as f:
-    f.write(urls_content)
-
-print("✅ Using apps registry to get Oscar URLs")
+if write_if_changed(urls_path, urls_content, encoding='ascii'):
+    print("✅ Using apps registry to get Oscar URLs")
+else:
+    print("No changes")
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from _base_io import write_if_changed
+
 urls_path = Path('config/urls.py')
 
 urls_content = '''from django.conf import settings
@@ -48,7 +50,7 @@ if settings.DEBUG:
         urlpatterns = [path("__debug__/", include(debug_toolbar.urls))] + urlpatterns
 '''
 
-with open(urls_path, 'w') as f:
-    f.write(urls_content)
-
-print("✅ Fixed URL configuration with correct Oscar 4.0 import")
+if write_if_changed(urls_path, urls_content):
+    print("✅ Fixed URL configuration with correct Oscar 4.0 import")
+else:
+    print("No changes")
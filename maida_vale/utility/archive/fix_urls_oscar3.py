@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from _base_io import write_if_changed
+
 urls_path = Path('config/urls.py')
 
 # Oscar 3.2.6 uses oscar.config.Shop which is already in INSTALLED_APPS
@@ -63,7 +65,7 @@ if settings.DEBUG:
         urlpatterns = [path("__debug__/", include(debug_toolbar.urls))] + urlpatterns
 '''
 
-with open(urls_path, 'w') as f:
-    f.write(urls_content)
-
-print("✅ Fixed URLs for Oscar 3.2.6 with individual app includes")
+if write_if_changed(urls_path, urls_content, encoding='ascii'):
+    print("✅ Fixed URLs for Oscar 3.2.6 with individual app includes")
+else:
+    print("No changes")
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from _base_io import write_if_changed
+
 urls_path = Path('config/urls.py')
 
 # Django-Oscar 3.2.6 uses oscar.app.Shop
@@ -51,7 +53,7 @@ if settings.DEBUG:
         urlpatterns = [path("__debug__/", include(debug_toolbar.urls))] + urlpatterns
 '''
 
-with open(urls_path, 'w') as f:
-    f.write(urls_content)
-
-print("✅ Fixed URLs for Django-Oscar 3.2.6")
+if write_if_changed(urls_path, urls_content, encoding='ascii'):
+    print("✅ Fixed URLs for Django-Oscar 3.2.6")
+else:
+    print("No changes")
@@ -5,10 +5,99 @@ Evaluates Django project structure for efficiency, scalability, and best practic
 """
 
 import os
+import re
 import json
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from itertools import islice
+
+# orjson is optional; fall back to the stdlib encoder when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files expected in each app; the optional ones don't trigger a recommendation
+EXPECTED_APP_FILES = {
+    'models.py': 'Data models',
+    'views.py': 'View logic',
+    'admin.py': 'Admin interface',
+    'apps.py': 'App configuration',
+    'urls.py': 'URL routing',
+    'serializers.py': 'API serializers',
+    'forms.py': 'Form definitions',
+    'tests.py': 'Tests'
+}
+OPTIONAL_APP_FILES = {'serializers.py', 'forms.py', 'tests.py', 'urls.py'}
+
+# Root-level files that should be cleaned up, with what each pattern catches
+CLEANUP_PATTERNS = {
+    '*.pyc': 'Python bytecode files',
+    '*.backup*': 'Backup files',
+    '*.log': 'Log files in root',
+    'fix_*.py': 'Temporary fix scripts',
+    '*_repair*.sh': 'Repair scripts',
+    '*_diagnostic*.sh': 'Diagnostic scripts'
+}
+# All patterns folded into one regex so each filename is tested with a single match
+_CLEANUP_RE = re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in CLEANUP_PATTERNS))
+
+# Directories the cleanup walk never descends into
+WALK_SKIP_DIRS = {
+    '.git', 'node_modules', '.venv', 'venv', 'staticfiles',
+    '__pycache__', '.mypy_cache', '.ruff_cache'
+}
+
+# Shell script written by _create_improvement_script, encoded once at import
+_IMPROVEMENT_SCRIPT = '''#!/bin/bash
+# Auto-generated structure improvement script
+
+echo "🚀 Implementing structure improvements..."
+
+# Create recommended directories
+mkdir -p maida_vale/api/v1
+mkdir -p maida_vale/common
+mkdir -p tests/unit
+mkdir -p tests/integration
+mkdir -p utility/archive
+mkdir -p utility/diagnostics
+
+# Move cleanup files
+echo "📦 Archiving old scripts..."
+mv -f fix_*.py utility/archive/ 2>/dev/null || true
+mv -f *_diagnostic*.sh utility/diagnostics/ 2>/dev/null || true
+mv -f *_repair*.sh utility/archive/ 2>/dev/null || true
+
+# Clean pycache
+echo "🧹 Cleaning cache..."
+find . -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null || true
+find . -type f -name "*.pyc" -delete 2>/dev/null || true
+
+# Create API structure
+cat > maida_vale/api/v1/__init__.py << 'PY'
+"""API v1 module"""
+__version__ = '1.0.0'
+PY
+
+cat > maida_vale/api/v1/urls.py << 'PY'
+from django.urls import path, include
+
+app_name = 'api_v1'
+
+urlpatterns = [
+    # Add your API endpoints here
+]
+PY
+
+echo "✅ Structure improvements complete!"
+echo "📝 Next steps:"
+echo "   1. Review and commit changes"
+echo "   2. Update INSTALLED_APPS if needed"
+echo "   3. Add API routing to main urls.py"
+'''.encode('utf-8')
 
 class ProjectStructureAnalyzer:
     def __init__(self, project_root="/Users/saman/Maida/maida_vale"):
@@ -16,13 +105,26 @@ class ProjectStructureAnalyzer:
         self.issues = []
         self.strengths = []
         self.recommendations = []
-        self.metrics = defaultdict(int)
+        self.metrics = Counter()
+        self._score = None
         
+    @staticmethod
+    def _listdir_set(directory):
+        """Return the entry names of a directory, or an empty set if it is missing"""
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name for entry in it}
+        except OSError:
+            return set()
+            
     def analyze(self):
         print("\n" + "="*70)
         print("PROJECT STRUCTURE ANALYSIS")
         print("="*70)
         
+        # Recompute the score for this run's findings
+        self._score = None
+        
         self.analyze_directory_structure()
         self.analyze_code_organization()
         self.analyze_cleanup_needs()
@@ -47,14 +149,15 @@ class ProjectStructureAnalyzer:
             'logs': 'Application logs'
         }
         
-        for dir_name, purpose in standard_dirs.items():
-            dir_path = self.project_root / dir_name
-            if dir_path.exists():
-                self.strengths.append(f"✓ {dir_name}: {purpose}")
-                self.metrics['standard_dirs'] += 1
-            else:
-                if dir_name in ['logs']:
-                    self.recommendations.append(f"Create {dir_name} directory for {purpose.lower()}")
+        # One listing of the project root answers every membership check
+        entries = self._listdir_set(self.project_root)
+        present = [d for d in standard_dirs if d in entries]
+        self.metrics['standard_dirs'] = len(present)
+        
+        self.strengths.extend(f"✓ {d}: {standard_dirs[d]}" for d in present)
+        
+        if 'logs' not in entries:
+            self.recommendations.append(f"Create logs directory for {standard_dirs['logs'].lower()}")
                     
     def analyze_code_organization(self):
         """Analyze code organization patterns"""
@@ -63,54 +166,45 @@ class ProjectStructureAnalyzer:
         # Check app structure
         app_dir = self.project_root / 'maida_vale'
         apps = ['users', 'nesosa', 'manufacturing', 'uk_compliance']
+        app_entries = self._listdir_set(app_dir)
         
-        for app in apps:
-            app_path = app_dir / app
-            if app_path.exists():
-                # Check for proper app structure
-                expected_files = {
-                    'models.py': 'Data models',
-                    'views.py': 'View logic',
-                    'admin.py': 'Admin interface',
-                    'apps.py': 'App configuration',
-                    'urls.py': 'URL routing',
-                    'serializers.py': 'API serializers',
-                    'forms.py': 'Form definitions',
-                    'tests.py': 'Tests'
-                }
-                
-                missing = []
-                for file_name in expected_files:
-                    if not (app_path / file_name).exists():
-                        if file_name not in ['serializers.py', 'forms.py', 'tests.py', 'urls.py']:
-                            missing.append(file_name)
-                            
-                if missing:
-                    self.recommendations.append(f"{app}: Add {', '.join(missing)}")
+        # Probe each app's directory concurrently; results come back in app order
+        present_apps = [app for app in apps if app in app_entries]
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            results = list(ex.map(self._check_app, present_apps))
+            
+        for app, missing in results:
+            if missing:
+                self.recommendations.append(f"{app}: Add {', '.join(missing)}")
                     
         # Check for API structure
-        api_dir = app_dir / 'api'
-        if not api_dir.exists():
+        if 'api' not in app_entries:
             self.recommendations.append("Consider creating maida_vale/api/ for centralized API endpoints")
             
+    def _check_app(self, app):
+        """Return (app, missing required files) for one app directory"""
+        present = self._listdir_set(self.project_root / 'maida_vale' / app)
+        missing = [f for f in EXPECTED_APP_FILES if f not in present and f not in OPTIONAL_APP_FILES]
+        return app, missing
+        
     def analyze_cleanup_needs(self):
         """Identify files that should be cleaned up"""
         print("\n🧹 Analyzing Cleanup Needs...")
         
-        cleanup_patterns = {
-            '*.pyc': 'Python bytecode files',
-            '*.backup*': 'Backup files',
-            '*.log': 'Log files in root',
-            'fix_*.py': 'Temporary fix scripts',
-            '*_repair*.sh': 'Repair scripts',
-            '*_diagnostic*.sh': 'Diagnostic scripts'
-        }
-        
         files_to_clean = []
-        for pattern, description in cleanup_patterns.items():
-            for file_path in self.project_root.glob(pattern):
-                if file_path.is_file():
-                    files_to_clean.append(file_path.name)
+        pycache_count = 0
+        root = str(self.project_root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Cleanup patterns only apply to files in the project root
+            if dirpath == root:
+                for file_name in filenames:
+                    if _CLEANUP_RE.match(file_name):
+                        files_to_clean.append(file_name)
+            # Count bytecode caches, then prune them and VCS/vendor trees;
+            # slice assignment so os.walk skips the removed directories
+            if '__pycache__' in dirnames:
+                pycache_count += 1
+            dirnames[:] = [d for d in dirnames if d not in WALK_SKIP_DIRS]
                     
         if len(files_to_clean) > 10:
             self.issues.append(f"Found {len(files_to_clean)} temporary/backup files that should be cleaned")
@@ -118,9 +212,8 @@ class ProjectStructureAnalyzer:
             self.recommendations.append("Delete or archive old backup files")
             
         # Check __pycache__ directories
-        pycache_dirs = list(self.project_root.rglob('__pycache__'))
-        if len(pycache_dirs) > 5:
-            self.recommendations.append(f"Clean {len(pycache_dirs)} __pycache__ directories")
+        if pycache_count > 5:
+            self.recommendations.append(f"Clean {pycache_count} __pycache__ directories")
             
     def analyze_scalability(self):
         """Analyze scalability aspects"""
@@ -193,11 +286,11 @@ class ProjectStructureAnalyzer:
         print("="*70)
         
         print("\n💪 STRENGTHS:")
-        for strength in self.strengths[:5]:
+        for strength in islice(self.strengths, 5):
             print(f"  {strength}")
             
         print("\n⚠️ ISSUES:")
-        for issue in self.issues[:5]:
+        for issue in islice(self.issues, 5):
             print(f"  • {issue}")
             
         print("\n📋 TOP RECOMMENDATIONS:")
@@ -233,8 +326,11 @@ class ProjectStructureAnalyzer:
             
         # Save detailed report
         report_path = self.project_root / f'structure_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, 'w') as f:
+                json.dump(report, f, indent=2)
             
         print(f"\n📄 Detailed report saved to: {report_path}")
         
@@ -242,73 +338,25 @@ class ProjectStructureAnalyzer:
         self._create_improvement_script()
         
     def _calculate_score(self):
-        """Calculate structure score"""
-        score = 50  # Base score
-        
-        # Add points for strengths
-        score += len(self.strengths) * 3
-        
-        # Subtract for issues
-        score -= len(self.issues) * 5
-        
-        # Cap at 0-100
-        return max(0, min(100, score))
+        """Calculate structure score, computed once per analysis"""
+        if self._score is None:
+            score = 50  # Base score
+            
+            # Add points for strengths
+            score += len(self.strengths) * 3
+            
+            # Subtract for issues
+            score -= len(self.issues) * 5
+            
+            # Cap at 0-100
+            self._score = max(0, min(100, score))
+        return self._score
         
     def _create_improvement_script(self):
         """Create script to implement improvements"""
         
         script_path = self.project_root / 'improve_structure.sh'
-        
-        script_content = '''#!/bin/bash
-# Auto-generated structure improvement script
-
-echo "🚀 Implementing structure improvements..."
-
-# Create recommended directories
-mkdir -p maida_vale/api/v1
-mkdir -p maida_vale/common
-mkdir -p tests/unit
-mkdir -p tests/integration
-mkdir -p utility/archive
-mkdir -p utility/diagnostics
-
-# Move cleanup files
-echo "📦 Archiving old scripts..."
-mv -f fix_*.py utility/archive/ 2>/dev/null || true
-mv -f *_diagnostic*.sh utility/diagnostics/ 2>/dev/null || true
-mv -f *_repair*.sh utility/archive/ 2>/dev/null || true
-
-# Clean pycache
-echo "🧹 Cleaning cache..."
-find . -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null || true
-find . -type f -name "*.pyc" -delete 2>/dev/null || true
-
-# Create API structure
-cat > maida_vale/api/v1/__init__.py << 'PY'
-"""API v1 module"""
-__version__ = '1.0.0'
-PY
-
-cat > maida_vale/api/v1/urls.py << 'PY'
-from django.urls import path, include
-
-app_name = 'api_v1'
-
-urlpatterns = [
-    # Add your API endpoints here
-]
-PY
-
-echo "✅ Structure improvements complete!"
-echo "📝 Next steps:"
-echo "   1. Review and commit changes"
-echo "   2. Update INSTALLED_APPS if needed"
-echo "   3. Add API routing to main urls.py"
-'''
-        
-        with open(script_path, 'w') as f:
-            f.write(script_content)
-            
+        script_path.write_bytes(_IMPROVEMENT_SCRIPT)
         script_path.chmod(0o755)
         print(f"\n🔧 Improvement script created: {script_path}")
         print("   Run: ./improve_structure.sh")